@@ -6,6 +6,9 @@ from enum import Enum
 
 # Database Models for Financial Data
 
+def _new_id() -> str:
+    return uuid.uuid4().hex
+
 class AccountType(str, Enum):
     CHECKING = "checking"
     SAVINGS = "savings"
@@ -42,7 +45,7 @@ class BudgetPeriod(str, Enum):
 
 # User Models
 class User(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     email: str
     full_name: str
     phone: Optional[str] = None
@@ -62,7 +65,7 @@ class UserCreate(BaseModel):
 
 # Account Models
 class Account(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     plaid_account_id: Optional[str] = None
     plaid_item_id: Optional[str] = None
@@ -94,7 +97,7 @@ class AccountUpdate(BaseModel):
 
 # Transaction Models
 class Transaction(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     account_id: str
     plaid_transaction_id: Optional[str] = None
@@ -134,7 +137,7 @@ class TransactionUpdate(BaseModel):
 
 # Budget Models
 class Budget(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     name: str
     period: BudgetPeriod = BudgetPeriod.MONTHLY
@@ -151,7 +154,7 @@ class Budget(BaseModel):
     ai_reasoning: Optional[str] = None
 
 class BudgetCategory(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     budget_id: str
     category: TransactionCategory
     allocated_amount: float
@@ -171,7 +174,7 @@ class BudgetCreate(BaseModel):
 
 # Financial Goal Models
 class FinancialGoal(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     name: str
     goal_type: GoalType
@@ -207,7 +210,7 @@ class GoalUpdate(BaseModel):
 
 # AI Insights Models
 class AIInsight(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     insight_type: str  # spending_pattern, budget_recommendation, goal_advice, etc.
     title: str
@@ -233,7 +236,7 @@ class AIInsightCreate(BaseModel):
 
 # Financial Health Score Models
 class FinancialHealthScore(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     overall_score: float  # 0-100
     spending_score: float  # How well they manage spending
@@ -251,7 +254,7 @@ class FinancialHealthScore(BaseModel):
 
 # Plaid Integration Models
 class PlaidItem(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     item_id: str
     access_token_encrypted: str
@@ -1,13 +1,15 @@
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import os
 import logging
 from datetime import datetime
 from typing import Optional
 
-# Simple in-memory storage for demo
-users_db = []
+# Simple in-memory storage for demo, indexed by casefolded email and by id
+users_by_email: dict[str, dict] = {}
+users_by_id: dict[str, dict] = {}
 
 # Pydantic models
 class UserCreate(BaseModel):
@@ -27,12 +29,27 @@ class User(BaseModel):
 app = FastAPI(
     title="AI Financial Super-App API",
     description="Billion-dollar AI-powered personal finance platform",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Create API router with /api prefix
 api_router = APIRouter(prefix="/api")
 
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Registered before CORS so CORS wraps it and the 500 keeps its CORS headers
+@app.middleware("http")
+async def catch_unhandled_errors(request: Request, call_next):
+    """Log unexpected errors with their traceback and return a generic 500"""
+    try:
+        return await call_next(request)
+    except Exception:
+        logger.exception("Unhandled error on %s", request.url.path)
+        return ORJSONResponse(status_code=500, content={"detail": "Internal error"})
+
 # CORS middleware - Allow all origins for now
 app.add_middleware(
     CORSMiddleware,
@@ -42,86 +59,85 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Static response bodies, built once at import
+_ROOT_PAYLOAD = {
+    "message": "AI Financial Super-App API",
+    "version": "1.0.0",
+    "status": "operational",
+    "features": [
+        "AI-powered financial insights",
+        "Smart budgeting recommendations", 
+        "Financial health scoring",
+        "User management",
+        "Comprehensive financial dashboard"
+    ]
+}
+
+_ROOT_REDIRECT_PAYLOAD = {
+    "message": "AI Financial Super-App Backend",
+    "api_docs": "/docs",
+    "api_endpoints": "/api/",
+    "health_check": "/api/health"
+}
 
 @api_router.get("/")
 async def root():
     """Root API endpoint"""
-    return {
-        "message": "AI Financial Super-App API",
-        "version": "1.0.0",
-        "status": "operational",
-        "features": [
-            "AI-powered financial insights",
-            "Smart budgeting recommendations", 
-            "Financial health scoring",
-            "User management",
-            "Comprehensive financial dashboard"
-        ],
-        "users_count": len(users_db)
-    }
+    return {**_ROOT_PAYLOAD, "users_count": len(users_by_id)}
 
 @api_router.get("/health")
 async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.utcnow(),
         "message": "Backend is running successfully",
-        "users_registered": len(users_db)
+        "users_registered": len(users_by_id)
     }
 
 @api_router.post("/users", response_model=User)
 async def create_user(user_data: UserCreate):
     """Create a new user"""
-    try:
-        # Check if user already exists
-        for existing_user in users_db:
-            if existing_user["email"] == user_data.email:
-                raise HTTPException(status_code=400, detail="User with this email already exists")
-        
-        # Create new user
-        new_user = {
-            "id": str(len(users_db) + 1),
-            "email": user_data.email,
-            "full_name": user_data.full_name,
-            "phone": user_data.phone or "",
-            "created_at": datetime.utcnow().isoformat(),
-            "subscription_tier": "free"
-        }
-        
-        # Add to our simple database
-        users_db.append(new_user)
-        
-        logger.info(f"Created new user: {new_user['email']} (ID: {new_user['id']})")
-        
-        return User(**new_user)
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error creating user: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to create user: {str(e)}")
+    # Check if user already exists (emails are case-insensitive)
+    key = user_data.email.casefold()
+    if key in users_by_email:
+        raise HTTPException(status_code=400, detail="User with this email already exists")
+
+    # Create new user
+    new_user = {
+        "id": str(len(users_by_id) + 1),
+        "email": user_data.email,
+        "full_name": user_data.full_name,
+        "phone": user_data.phone or "",
+        "created_at": datetime.utcnow().isoformat(),
+        "subscription_tier": "free"
+    }
+
+    # Add to our simple database
+    users_by_email[key] = new_user
+    users_by_id[new_user["id"]] = new_user
+
+    logger.info("Created new user: %s (ID: %s)", new_user["email"], new_user["id"])
+
+    return User.model_construct(**new_user)
 
 @api_router.get("/users")
 async def get_all_users():
     """Get all users (for demo purposes)"""
     return {
-        "users": users_db,
-        "total": len(users_db),
+        "users": list(users_by_id.values()),
+        "total": len(users_by_id),
         "message": "All registered users"
     }
 
 @api_router.get("/users/{user_id}")
 async def get_user(user_id: str):
     """Get a specific user by ID"""
-    for user in users_db:
-        if user["id"] == user_id:
-            return User(**user)
+    user = users_by_id.get(user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
     
-    raise HTTPException(status_code=404, detail="User not found")
+    return User.model_construct(**user)
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -129,13 +145,8 @@ app.include_router(api_router)
 # Root redirect
 @app.get("/")
 async def root_redirect():
-    return {
-        "message": "AI Financial Super-App Backend",
-        "api_docs": "/docs",
-        "api_endpoints": "/api/",
-        "health_check": "/api/health"
-    }
+    return _ROOT_REDIRECT_PAYLOAD
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    uvicorn.run(app, host="0.0.0.0", port=8001, backlog=4096, timeout_keep_alive=75)